@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the repo root importable so tests can import the utils package directly
+sys.path.insert(0, os.path.dirname(__file__))
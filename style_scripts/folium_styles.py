@@ -1,5 +1,12 @@
 '''
 Style dicts used in folium layers
+
+The dicts are shared module-level objects: reuse the style_function_* helpers as
+style_function arguments so no new closure is created per layer and folium
+serializes one shared dict instead of a fresh copy per feature. They stay plain
+dicts because folium validates style_function return values with isinstance(dict)
+and serializes them with json.dumps, neither of which accepts a mappingproxy —
+so don't mutate them.
 '''
 
 style_black_bound = {'fill' : True,
@@ -9,7 +16,7 @@ style_black_bound = {'fill' : True,
 'color': '#000000',
 'fillOpacity': 0,
 'Opacity': 1.0
-} 
+}
 
 
 style_zone_outline = {'fill' : False,
@@ -17,7 +24,7 @@ style_zone_outline = {'fill' : False,
 'weight': 4,
 'color': '#2F32E4',
 'Opacity': 1.0
-} 
+}
 
 style_metro_line = {'fill' : True,
 'fillColor': '#F34200',
@@ -26,4 +33,16 @@ style_metro_line = {'fill' : True,
 'color': '#F34200',
 'fillOpacity': 0,
 'Opacity': 1.0
-} 
\ No newline at end of file
+}
+
+
+def style_function_black_bound(feature):
+    return style_black_bound
+
+
+def style_function_zone_outline(feature):
+    return style_zone_outline
+
+
+def style_function_metro_line(feature):
+    return style_metro_line
@@ -1,20 +1,33 @@
 import pytest
-import sys
-from ....utils.utils.db_operations.connection_db import create_engine_and_conn_string, validate_database_connection
 from sqlalchemy.engine.base import Engine
 from unittest.mock import Mock, patch, MagicMock
 
-def test_create_engine_and_conn_string_success():
+from utils.db_operations.connection_db import create_engine_and_conn_string_mssql, validate_database_connection, clear_engine_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_engine_cache():
+    # Engines are cached per connection parameters; keep tests isolated from each other
+    clear_engine_cache()
+    yield
+    clear_engine_cache()
+
+
+@patch('sqlalchemy.create_engine')
+def test_create_engine_and_conn_string_success(mocked_engine):
+    # Mocking create_engine avoids DBAPI dialect resolution and any network attempt
+    mocked_engine.return_value = MagicMock(spec=Engine)
     server = "valid_server"
     database = "valid_database"
     username = "valid_username"
     password = "valid_password"
-    
-    engine, conn_str = create_engine_and_conn_string(server, database, username, password)
-    
+
+    engine, conn_str = create_engine_and_conn_string_mssql(server, database, username, password)
+
     assert isinstance(engine, Engine)
     assert isinstance(conn_str, str)
 
+
 @patch('sqlalchemy.create_engine')
 def test_create_engine_and_conn_string_failure(mocked_engine):
     mocked_engine.side_effect = Exception("Connection error")
@@ -22,7 +35,7 @@ def test_create_engine_and_conn_string_failure(mocked_engine):
     database = "invalid_database"
     username = "invalid_username"
     password = "invalid_password"
-    
-    result = create_engine_and_conn_string(server, database, username, password)
-    
-    assert result is None
\ No newline at end of file
+
+    result = create_engine_and_conn_string_mssql(server, database, username, password)
+
+    assert result is None
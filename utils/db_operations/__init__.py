@@ -1,19 +1,45 @@
-from .connection_db import create_engine_and_conn_string_mssql, create_engine_and_conn_string_postgres, validate_database_connection
-
-from .load_credentials import import_db_credentials_json
-
-from .validate_tables import check_table_exists
-
-from .map_table_data_types import map_dataframe_dtypes_to_azure_ms_sql, map_dataframe_dtypes_to_sqlalchemy, is_wkt_geometry
-
-from .create_table import create_table_in_sqldb, create_table_in_pgdb
-
-from .load_table import load_data_df
-
-from .query_table import query_database_to_df, query_database_to_gdf, run_sql_script, check_table_has_data
-
-from .mssql import create_spatial_index_uk_bounding, create_spatial_index_world_bounding, set_table_stsrid, add_stsrid_constraint
-
-from .create_schema import ensure_schema_exists
-
-from .clear_tables import clear_table_if_not_empty
\ No newline at end of file
+# Re-exports are resolved lazily (PEP 562) so that importing utils.db_operations does not
+# pay the import cost of heavy dependencies (geopandas, geoalchemy2, shapely) until the
+# name that needs them is actually used.
+_LAZY_IMPORTS = {
+    'create_engine_and_conn_string_mssql': '.connection_db',
+    'create_engine_and_conn_string_postgres': '.connection_db',
+    'validate_database_connection': '.connection_db',
+    'create_async_engine_postgres': '.connection_db',
+    'clear_engine_cache': '.connection_db',
+    'import_db_credentials_json': '.load_credentials',
+    'check_table_exists': '.validate_tables',
+    'map_dataframe_dtypes_to_azure_ms_sql': '.map_table_data_types',
+    'map_dataframe_dtypes_to_sqlalchemy': '.map_table_data_types',
+    'is_wkt_geometry': '.map_table_data_types',
+    'create_table_in_sqldb': '.create_table',
+    'create_table_in_pgdb': '.create_table',
+    'create_tables_batch': '.create_table',
+    'load_data_df': '.load_table',
+    'query_database_to_df': '.query_table',
+    'query_database_to_gdf': '.query_table',
+    'run_sql_script': '.query_table',
+    'check_table_has_data': '.query_table',
+    'create_spatial_index_uk_bounding': '.mssql',
+    'create_spatial_index_world_bounding': '.mssql',
+    'set_table_stsrid': '.mssql',
+    'add_stsrid_constraint': '.mssql',
+    'ensure_schema_exists': '.create_schema',
+    'aensure_schema_exists': '.create_schema',
+    'clear_table_if_not_empty': '.clear_tables',
+    'aclear_table_if_not_empty': '.clear_tables',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        module = import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so the lookup only happens once
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
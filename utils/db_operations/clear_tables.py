@@ -1,49 +1,126 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..logger.default_logger import PrintLogger
+from .identifiers import validate_identifier
 
-def clear_table_if_not_empty(engine, schema, table_name, logger=PrintLogger()):
+def clear_table_if_not_empty(engine, schema, table_name, cascade=False, logger=PrintLogger()):
     """
     Checks if a PostgreSQL table within a specified schema has any data and clears it if so, using an SQLAlchemy engine.
 
+    Clearing uses TRUNCATE, which is effectively O(1), reclaims disk space immediately and writes a
+    single WAL record, instead of DELETE which scans the table and logs every row. If TRUNCATE is
+    unsupported or blocked by foreign key references, the function falls back to the old DELETE path.
+    Sequences owned by the table keep their positions (CONTINUE IDENTITY, the default), matching
+    what DELETE would leave behind.
+
     Args:
         engine: SQLAlchemy engine object. Represents the database connection where the operation will be executed.
         schema: str. Name of the schema containing the table.
         table_name: str. Name of the table to check and potentially clear.
+        cascade: bool, optional. If True, uses TRUNCATE ... CASCADE to also clear tables referencing this one via foreign keys.
         logger: Logger object, optional. Logger for recording messages during the operation.
 
     Returns:
         bool: True if the table was cleared, False if the table was already empty.
     """
+    # Identifier names are spliced into the SQL text, so validate them first
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
     try:
-        with engine.connect() as conn:
-            # Begin a transaction
-            trans = conn.begin()
-            
-            # Check if the table has any data
-            query_check = f"SELECT COUNT(*) FROM \"{schema}\".\"{table_name}\""
+        with engine.begin() as conn:  # Commits on success, rolls back on error
+            # Check if the table has any data; EXISTS stops at the first row instead of
+            # scanning the whole table like COUNT(*)
+            query_check = f"SELECT EXISTS (SELECT 1 FROM \"{schema}\".\"{table_name}\" LIMIT 1)"
             result = conn.execute(text(query_check))
-            count = result.scalar()
-            
-            if count > 0:
+            has_data = result.scalar()
+
+            if has_data:
                 # Clear the table if it has data
-                query_delete = f"DELETE FROM \"{schema}\".\"{table_name}\""
-                conn.execute(text(query_delete))
-                trans.commit()  # Commit the transaction
-                logger.info(f"Table '{schema}.{table_name}' cleared, {count} rows deleted.")
+                referential_action = "CASCADE" if cascade else "RESTRICT"
+                query_truncate = f"TRUNCATE TABLE \"{schema}\".\"{table_name}\" {referential_action}"
+                try:
+                    # Run the TRUNCATE on a savepoint so a failure doesn't abort the outer transaction
+                    with conn.begin_nested():
+                        conn.execute(text(query_truncate))
+                except SQLAlchemyError as truncate_error:
+                    # Fall back to DELETE when TRUNCATE is unsupported (0A000) or blocked by FKs (23503)
+                    sqlstate = getattr(getattr(truncate_error, 'orig', None), 'pgcode', None)
+                    if sqlstate in ('0A000', '23503'):
+                        logger.info("TRUNCATE not possible (%s), falling back to DELETE.", sqlstate)
+                        # DELETE with RETURNING gives the rows-deleted count in the same round-trip
+                        query_delete = (f"WITH d AS (DELETE FROM \"{schema}\".\"{table_name}\" RETURNING 1) "
+                                        f"SELECT COUNT(*) FROM d")
+                        deleted = conn.execute(text(query_delete)).scalar()
+                        logger.info("Table '%s.%s' cleared, %s rows deleted.", schema, table_name, deleted)
+                        return True
+                    else:
+                        raise
+                logger.info("Table '%s.%s' cleared.", schema, table_name)
                 return True
             else:
-                logger.info(f"Table '{schema}.{table_name}' is already empty.")
+                logger.info("Table '%s.%s' is already empty.", schema, table_name)
                 return False
     except SQLAlchemyError as e:
-        logger.error(f"An error occurred during table clearing: {e}")
-        if 'trans' in locals():
-            trans.rollback()  # Rollback the transaction in case of error
+        logger.error("An error occurred during table clearing: %s", e)
         return False
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
-        if 'trans' in locals():
-            trans.rollback()
+        logger.error("An unexpected error occurred: %s", e)
         return False
 
+
+async def aclear_table_if_not_empty(engine, schema, table_name, cascade=False, logger=PrintLogger()):
+    """
+    Async variant of clear_table_if_not_empty for use with an asyncpg engine.
+
+    The clearing workload is round-trip-bound, so multiple tables can be cleared
+    concurrently with asyncio.gather instead of serially:
+
+        await asyncio.gather(*[aclear_table_if_not_empty(engine, schema, t) for t in tables])
+
+    Args:
+        engine: Async SQLAlchemy engine object (see create_async_engine_postgres).
+        schema: str. Name of the schema containing the table.
+        table_name: str. Name of the table to check and potentially clear.
+        cascade: bool, optional. If True, uses TRUNCATE ... CASCADE to also clear tables referencing this one via foreign keys.
+        logger: Logger object, optional. Logger for recording messages during the operation.
+
+    Returns:
+        bool: True if the table was cleared, False if the table was already empty.
+    """
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
+    try:
+        async with engine.begin() as conn:
+            query_check = f"SELECT EXISTS (SELECT 1 FROM \"{schema}\".\"{table_name}\" LIMIT 1)"
+            result = await conn.execute(text(query_check))
+            has_data = result.scalar()
+
+            if has_data:
+                referential_action = "CASCADE" if cascade else "RESTRICT"
+                query_truncate = f"TRUNCATE TABLE \"{schema}\".\"{table_name}\" {referential_action}"
+                try:
+                    async with conn.begin_nested():
+                        await conn.execute(text(query_truncate))
+                except SQLAlchemyError as truncate_error:
+                    sqlstate = getattr(getattr(truncate_error, 'orig', None), 'pgcode', None)
+                    if sqlstate in ('0A000', '23503'):
+                        logger.info("TRUNCATE not possible (%s), falling back to DELETE.", sqlstate)
+                        query_delete = (f"WITH d AS (DELETE FROM \"{schema}\".\"{table_name}\" RETURNING 1) "
+                                        f"SELECT COUNT(*) FROM d")
+                        deleted = (await conn.execute(text(query_delete))).scalar()
+                        logger.info("Table '%s.%s' cleared, %s rows deleted.", schema, table_name, deleted)
+                        return True
+                    else:
+                        raise
+                logger.info("Table '%s.%s' cleared.", schema, table_name)
+                return True
+            else:
+                logger.info("Table '%s.%s' is already empty.", schema, table_name)
+                return False
+    except SQLAlchemyError as e:
+        logger.error("An error occurred during table clearing: %s", e)
+        return False
+    except Exception as e:
+        logger.error("An unexpected error occurred: %s", e)
+        return False
@@ -1,19 +1,100 @@
+import os
 import sys
+import hashlib
 import logging
+import threading
+import contextlib
 import sqlalchemy
 from urllib.parse import quote_plus
 
 from ..logger.default_logger import PrintLogger
 
-def create_engine_and_conn_string_mssql(server, database, username, password, logger=PrintLogger()):
+# Connection pool defaults, overridable via environment variables
+_DEFAULT_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+_DEFAULT_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+_DEFAULT_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+_DEFAULT_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+
+# Cache of engines keyed on connection parameters, so repeated calls reuse the same
+# engine (and its connection pool) instead of rebuilding dialect state per call.
+_engine_cache = {}
+_engine_cache_lock = threading.Lock()
+
+
+def _engine_cache_key(dialect, server, database, username, password, port=None, driver=None,
+                      pool_settings=None):
+    # The password is hashed so it is never held in the cache key itself. Pool settings
+    # are part of the key so a call with different pool parameters gets its own engine
+    # rather than silently reusing one configured differently.
+    password_hash = hashlib.sha256(password.encode()).hexdigest()
+    return (dialect, server, database, username, port, driver, password_hash, pool_settings)
+
+
+def _dispose_cached_engines_after_fork():
+    # Pooled connections are not valid across forks, so drop them in the child
+    for engine in _engine_cache.values():
+        engine.dispose(close=False)
+    _engine_cache.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_dispose_cached_engines_after_fork)
+
+
+def clear_engine_cache():
+    """
+    Clears the engine cache, disposing any pooled connections. Mainly useful in tests
+    or when credentials change at runtime.
+    """
+    with _engine_cache_lock:
+        for engine in _engine_cache.values():
+            engine.dispose()
+        _engine_cache.clear()
+
+
+def connection_scope(engine_or_conn):
+    """
+    Returns a context manager yielding a Connection for either an Engine or an
+    already-open Connection.
+
+    Helpers that accept engine_or_conn use this so callers chaining several queries
+    can open one connection (or transaction) and pass it through, instead of paying
+    a pool checkout per call. A passed-in Connection is yielded as-is and left open
+    on exit; an Engine checks a connection out and returns it when the block ends.
+
+    Args:
+        engine_or_conn: A SQLAlchemy Engine or an open Connection.
+
+    Returns:
+        A context manager yielding a sqlalchemy.engine.Connection.
+    """
+    if isinstance(engine_or_conn, sqlalchemy.engine.Connection):
+        return contextlib.nullcontext(engine_or_conn)
+    return engine_or_conn.connect()
+
+
+def create_engine_and_conn_string_mssql(server, database, username, password,
+                                        pool_size=_DEFAULT_POOL_SIZE, max_overflow=_DEFAULT_MAX_OVERFLOW,
+                                        pool_timeout=_DEFAULT_POOL_TIMEOUT, pool_recycle=_DEFAULT_POOL_RECYCLE,
+                                        pool_pre_ping=True, pool_use_lifo=True, logger=PrintLogger()):
     """
     Creates a SQLAlchemy engine and generates a connection string for an Azure MSSQL database with the provided credentials.
 
+    Engines are cached per set of connection parameters, so repeated calls with the same
+    credentials return the same engine and connection pool.
+
     Args:
         server (str): The address of the SQL server (e.g., 'your_server.database.windows.net').
         database (str): The name of the database to connect to.
         username (str): The username for the database login.
         password (str): The password for the database login.
+        pool_size (int): Number of connections to keep open in the pool. Defaults to 10 (env var DB_POOL_SIZE).
+        max_overflow (int): Additional connections allowed beyond pool_size. Defaults to 20 (env var DB_MAX_OVERFLOW).
+        pool_timeout (int): Seconds to wait for a pooled connection before giving up. Defaults to 30 (env var DB_POOL_TIMEOUT).
+        pool_recycle (int): Seconds after which pooled connections are recycled. Defaults to 1800 (env var DB_POOL_RECYCLE).
+        pool_pre_ping (bool): If True, tests connections for liveness before handing them out. Defaults to True.
+        pool_use_lifo (bool): If True, checks out the most recently used connection first, keeping hot
+            connections warm and letting overflow connections idle out. Defaults to True.
         logger (object): A logging object with info, error, and debug methods. Defaults to an instance of PrintLogger.
 
     Returns:
@@ -22,28 +103,54 @@ def create_engine_and_conn_string_mssql(server, database, username, password, lo
     Note:
         Ensure that the ODBC Driver 17 for SQL Server is installed on your system. Credentials should be managed securely.
     """
+    driver = "ODBC+Driver+17+for+SQL+Server"
+    pool_settings = (pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping, pool_use_lifo)
+    key = _engine_cache_key('mssql', server, database, username, password, driver=driver,
+                            pool_settings=pool_settings)
     password = quote_plus(password)
-    connection_string = f"mssql+pyodbc://{username}:{password}@{server}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
+    connection_string = f"mssql+pyodbc://{username}:{password}@{server}/{database}?driver={driver}"
     try:
-        logger.info("Creating SQLAlchemy engine & connection string...")
-        engine = sqlalchemy.create_engine(connection_string, echo=False)
-        logger.info("Engine & connection string created successfully using SQLAlchemy!")
+        with _engine_cache_lock:
+            engine = _engine_cache.get(key)
+            if engine is None:
+                logger.info("Creating SQLAlchemy engine & connection string...")
+                engine = sqlalchemy.create_engine(connection_string, echo=False,
+                                                  pool_size=pool_size, max_overflow=max_overflow,
+                                                  pool_timeout=pool_timeout, pool_recycle=pool_recycle,
+                                                  pool_pre_ping=pool_pre_ping, pool_use_lifo=pool_use_lifo)
+                _engine_cache[key] = engine
+                logger.info("Engine & connection string created successfully using SQLAlchemy!")
+            else:
+                logger.info("Reusing cached SQLAlchemy engine.")
         return engine, connection_string
     except Exception as e:
         logger.error("Error creating engine using SQLAlchemy: %s", e)
         return None
-    
-    
-def create_engine_and_conn_string_postgres(server, database, username, password, port=5432, logger=PrintLogger()):
+
+
+def create_engine_and_conn_string_postgres(server, database, username, password, port=5432,
+                                           pool_size=_DEFAULT_POOL_SIZE, max_overflow=_DEFAULT_MAX_OVERFLOW,
+                                           pool_timeout=_DEFAULT_POOL_TIMEOUT, pool_recycle=_DEFAULT_POOL_RECYCLE,
+                                           pool_pre_ping=True, pool_use_lifo=True, logger=PrintLogger()):
     """
     Creates a SQLAlchemy engine and generates a connection string for a local PostgreSQL database with the provided credentials.
 
+    Engines are cached per set of connection parameters, so repeated calls with the same
+    credentials return the same engine and connection pool.
+
     Args:
         server (str): The address of the PostgreSQL server, typically 'localhost' for a local database.
         database (str): The name of the database to connect to.
         username (str): The username for the database login.
         password (str): The password for the database login.
         port (int): The port on which the PostgreSQL server is running, defaults to 5432.
+        pool_size (int): Number of connections to keep open in the pool. Defaults to 10 (env var DB_POOL_SIZE).
+        max_overflow (int): Additional connections allowed beyond pool_size. Defaults to 20 (env var DB_MAX_OVERFLOW).
+        pool_timeout (int): Seconds to wait for a pooled connection before giving up. Defaults to 30 (env var DB_POOL_TIMEOUT).
+        pool_recycle (int): Seconds after which pooled connections are recycled. Defaults to 1800 (env var DB_POOL_RECYCLE).
+        pool_pre_ping (bool): If True, tests connections for liveness before handing them out. Defaults to True.
+        pool_use_lifo (bool): If True, checks out the most recently used connection first, keeping hot
+            connections warm and letting overflow connections idle out. Defaults to True.
         logger (object): A logging object with info, error, and debug methods. Defaults to an instance of PrintLogger.
 
     Returns:
@@ -52,17 +159,69 @@ def create_engine_and_conn_string_postgres(server, database, username, password,
     Note:
         Ensure that psycopg2 is installed on your system. Credentials should be managed securely.
     """
+    pool_settings = (pool_size, max_overflow, pool_timeout, pool_recycle, pool_pre_ping, pool_use_lifo)
+    key = _engine_cache_key('postgresql', server, database, username, password, port=port,
+                            pool_settings=pool_settings)
     password = quote_plus(password)
     connection_string = f"postgresql+psycopg2://{username}:{password}@{server}:{port}/{database}"
     try:
-        logger.info("Creating SQLAlchemy engine & connection string for PostgreSQL...")
-        engine = sqlalchemy.create_engine(connection_string, echo=False)
-        logger.info("Engine & connection string created successfully using SQLAlchemy for PostgreSQL!")
+        with _engine_cache_lock:
+            engine = _engine_cache.get(key)
+            if engine is None:
+                logger.info("Creating SQLAlchemy engine & connection string for PostgreSQL...")
+                engine = sqlalchemy.create_engine(connection_string, echo=False,
+                                                  pool_size=pool_size, max_overflow=max_overflow,
+                                                  pool_timeout=pool_timeout, pool_recycle=pool_recycle,
+                                                  pool_pre_ping=pool_pre_ping, pool_use_lifo=pool_use_lifo,
+                                                  executemany_mode="values_plus_batch",
+                                                  insertmanyvalues_page_size=10000,
+                                                  executemany_batch_page_size=1000,
+                                                  connect_args={"connect_timeout": 5, "application_name": "geospatial_demo"})
+                _engine_cache[key] = engine
+                logger.info("Engine & connection string created successfully using SQLAlchemy for PostgreSQL!")
+            else:
+                logger.info("Reusing cached SQLAlchemy engine for PostgreSQL.")
         return engine, connection_string
     except Exception as e:
         logger.error("Error creating engine using SQLAlchemy for PostgreSQL: %s", e)
         return None
-    
+
+def create_async_engine_postgres(server, database, username, password, port=5432, logger=PrintLogger()):
+    """
+    Creates an async SQLAlchemy engine and connection string for a PostgreSQL database using asyncpg.
+
+    The asyncpg driver speaks the binary protocol with far less Python overhead than
+    psycopg2, and the async API lets callers run many round-trip-bound operations
+    (clears, schema checks) concurrently with asyncio.gather instead of serially.
+
+    Args:
+        server (str): The address of the PostgreSQL server, typically 'localhost' for a local database.
+        database (str): The name of the database to connect to.
+        username (str): The username for the database login.
+        password (str): The password for the database login.
+        port (int): The port on which the PostgreSQL server is running, defaults to 5432.
+        logger (object): A logging object with info, error, and debug methods. Defaults to an instance of PrintLogger.
+
+    Returns:
+        sqlalchemy.ext.asyncio.AsyncEngine or None: An async engine object if creation succeeds, or None if it fails.
+
+    Note:
+        Ensure that asyncpg is installed on your system. Credentials should be managed securely.
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    password = quote_plus(password)
+    connection_string = f"postgresql+asyncpg://{username}:{password}@{server}:{port}/{database}"
+    try:
+        logger.info("Creating async SQLAlchemy engine & connection string for PostgreSQL...")
+        engine = create_async_engine(connection_string, echo=False)
+        logger.info("Async engine & connection string created successfully using SQLAlchemy for PostgreSQL!")
+        return engine, connection_string
+    except Exception as e:
+        logger.error("Error creating async engine using SQLAlchemy for PostgreSQL: %s", e)
+        return None
+
+
 def validate_database_connection(engine, logger=PrintLogger()):
     """
     Validates the database connection using the provided SQLAlchemy engine.
@@ -84,7 +243,7 @@ def validate_database_connection(engine, logger=PrintLogger()):
                 return True
                 # Connection is automatically closed here, when the 'with' block is exited
         except Exception as e:
-            logger.error(f"Test connection failed: {e}")
+            logger.error("Test connection failed: %s", e)
             return False
     else:
         logger.error("Engine object is None, cannot test connection")
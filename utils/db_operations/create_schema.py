@@ -1,24 +1,53 @@
 from sqlalchemy import create_engine, text
 
 from ..logger.default_logger import PrintLogger
+from .identifiers import validate_identifier
 
 def ensure_schema_exists(engine, schema, logger=PrintLogger()):
     """
     Ensures that the specified schema exists in the database; creates it if it does not.
 
+    On dialects that support it (PostgreSQL, MSSQL 2022+), this is a single atomic
+    CREATE SCHEMA IF NOT EXISTS statement rather than a catalog lookup followed by a
+    conditional CREATE, saving a round-trip per call.
+
     Args:
         engine (sqlalchemy.engine.Engine): SQLAlchemy engine connected to the database.
         schema (str): The name of the schema to check and create if necessary.
         logger (Logger): Logger for logging messages.
     """
+    # The schema name is spliced into the SQL text, so validate it first
+    schema = validate_identifier(schema)
     with engine.begin() as conn:  # Use engine.begin() to automatically commit or rollback
-        # Check if the schema exists
-        schema_exists_query = text("SELECT schema_name FROM information_schema.schemata WHERE schema_name = :schema")
-        schema_exists = conn.execute(schema_exists_query, {'schema': schema}).fetchone()
-
-        # If the schema does not exist, create it
-        if not schema_exists:
-            conn.execute(text(f"CREATE SCHEMA \"{schema}\""))
-            logger.info(f"Schema '{schema}' created.")
+        if conn.dialect.name == 'mssql':
+            # Older MSSQL has no IF NOT EXISTS, so keep the two-query path there
+            schema_exists_query = text("SELECT schema_name FROM information_schema.schemata WHERE schema_name = :schema")
+            schema_exists = conn.execute(schema_exists_query, {'schema': schema}).fetchone()
+
+            # If the schema does not exist, create it
+            if not schema_exists:
+                conn.execute(text(f"CREATE SCHEMA \"{schema}\""))
+                logger.info("Schema '%s' created.", schema)
+            else:
+                logger.info("Schema '%s' already exists.", schema)
         else:
-            logger.info(f"Schema '{schema}' already exists.")
\ No newline at end of file
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS \"{schema}\""))
+            logger.info("Schema '%s' ensured.", schema)
+
+
+async def aensure_schema_exists(engine, schema, logger=PrintLogger()):
+    """
+    Async variant of ensure_schema_exists for use with an asyncpg engine.
+
+    Schema checks are round-trip-bound, so several can be run concurrently with
+    asyncio.gather when setting up many schemas.
+
+    Args:
+        engine (sqlalchemy.ext.asyncio.AsyncEngine): Async engine connected to the database.
+        schema (str): The name of the schema to check and create if necessary.
+        logger (Logger): Logger for logging messages.
+    """
+    schema = validate_identifier(schema)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS \"{schema}\""))
+        logger.info("Schema '%s' ensured.", schema)
\ No newline at end of file
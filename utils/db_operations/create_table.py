@@ -10,68 +10,94 @@ class SysGeometry(UserDefinedType):
     def get_col_spec(self):
         return "[sys].[geometry]"
 
-# Assuming PrintLogger is correctly implemented
-from ..logger.default_logger import PrintLogger
-
-def create_table_in_sqldb(engine, table_name, schema, column_names, column_types=None, primary_keys=None, default_type=NVARCHAR(None), default_primary=NVARCHAR(50), logger=PrintLogger()):
+def _define_table(metadata, table_name, schema, column_names, column_types=None, primary_keys=None,
+                  default_type=TEXT, default_primary=TEXT(50), use_sys_geometry=False, logger=PrintLogger()):
     """
-    Creates a table in a SQL database using SQLAlchemy, with support for custom geometry data type.
-
-    This function allows for dynamic creation of database tables with specified columns and data types,
-    including a custom type for handling SQL Server's geometry data type.
+    Builds a Table object from a column specification and attaches it to the given metadata.
 
     Args:
-        engine: SQLAlchemy engine object. Represents the database connection where the table will be created.
-        table_name: str. Name of the table to be created.
+        metadata: SQLAlchemy MetaData object the table is registered on.
+        table_name: str. Name of the table to be defined.
         schema: str. Database schema in which the table is to be created.
         column_names: list of str. Names of the columns to be included in the table.
-        column_types: dict, optional. Mapping of column names to SQLAlchemy data types. If not provided, 
-            all columns will use the default data type.
+        column_types: dict, optional. Mapping of column names to SQLAlchemy data types.
         primary_keys: list of str, optional. Names of columns that should be set as primary keys.
-        default_type: SQLAlchemy data type, optional. Default data type to be used for columns 
-            not specified in column_types. Defaults to NVARCHAR.
-        logger: Logger object, optional. Logger for recording messages during the table creation process.
+        default_type: SQLAlchemy data type, optional. Default data type for unspecified columns.
+        default_primary: SQLAlchemy data type, optional. Data type used for primary key columns.
+        use_sys_geometry: bool, optional. If True, the 'geometry' column uses the custom
+            SysGeometry type for SQL Server instead of the type from column_types.
+        logger: Logger object, optional. Logger for recording messages while defining columns.
 
     Returns:
-        None. The function creates a table in the database but does not return any value.
+        sqlalchemy.Table: The table object registered on the metadata.
     """
-    # Initialize metadata object
-    metadata = MetaData()
+    # Normalize once so the per-column membership tests are O(1)
+    pk_set = set(primary_keys or ())
+    col_types = column_types or {}
 
     # Define columns for the table
     columns = []
     for name in column_names:
+        is_pk = name in pk_set
         # Check if the column is a primary key and set type to type specified
-        if primary_keys and name in primary_keys:
-            logger.info(f"Primary key detected setting to {default_primary}")
+        if is_pk:
+            logger.info("Primary key detected setting to %s", default_primary)
             col_type = default_primary
         # Determine the column type
-        elif  column_types and name in column_types:
-            if name == 'geometry':
+        elif name in col_types:
+            if use_sys_geometry and name == 'geometry':
                 # Use custom SysGeometry type for the geometry column
-                logger.info(f"Geometry detected, setting custom geometry data type")
+                logger.info("Geometry detected, setting custom geometry data type")
                 col_type = SysGeometry()
             else:
-                col_type = column_types[name]
+                col_type = col_types[name]
         else:
             col_type = default_type
 
         # Define the column
-        columns.append(Column(name, col_type, primary_key=name in primary_keys if primary_keys else False))
+        columns.append(Column(name, col_type, primary_key=is_pk))
 
     # Define the table with schema
-    table = Table(table_name, metadata, *columns, schema=schema)
+    return Table(table_name, metadata, *columns, schema=schema)
+
+
+def create_table_in_sqldb(engine, table_name, schema, column_names, column_types=None, primary_keys=None, default_type=NVARCHAR(None), default_primary=NVARCHAR(50), logger=PrintLogger()):
+    """
+    Creates a table in a SQL database using SQLAlchemy, with support for custom geometry data type.
+
+    This function allows for dynamic creation of database tables with specified columns and data types,
+    including a custom type for handling SQL Server's geometry data type.
+
+    Args:
+        engine: SQLAlchemy engine object. Represents the database connection where the table will be created.
+        table_name: str. Name of the table to be created.
+        schema: str. Database schema in which the table is to be created.
+        column_names: list of str. Names of the columns to be included in the table.
+        column_types: dict, optional. Mapping of column names to SQLAlchemy data types. If not provided,
+            all columns will use the default data type.
+        primary_keys: list of str, optional. Names of columns that should be set as primary keys.
+        default_type: SQLAlchemy data type, optional. Default data type to be used for columns
+            not specified in column_types. Defaults to NVARCHAR.
+        logger: Logger object, optional. Logger for recording messages during the table creation process.
+
+    Returns:
+        None. The function creates a table in the database but does not return any value.
+    """
+    # Initialize metadata object
+    metadata = MetaData()
+    _define_table(metadata, table_name, schema, column_names, column_types, primary_keys,
+                  default_type, default_primary, use_sys_geometry=True, logger=logger)
 
     try:
         # Create the table in the database
         metadata.create_all(engine)
-        logger.info(f"Table '{table_name}' created successfully.")
+        logger.info("Table '%s' created successfully.", table_name)
     except Exception as e:
-        logger.error(f"Error creating table: {e}")
+        logger.error("Error creating table: %s", e)
         raise
 
     return None
-    
+
 
 def create_table_in_pgdb(engine, table_name, schema, column_names, column_types=None, primary_keys=None, default_type=TEXT, default_primary=TEXT(50), logger=PrintLogger()):
     """
@@ -85,10 +111,10 @@ def create_table_in_pgdb(engine, table_name, schema, column_names, column_types=
         table_name: str. Name of the table to be created.
         schema: str. Database schema in which the table is to be created.
         column_names: list of str. Names of the columns to be included in the table.
-        column_types: dict, optional. Mapping of column names to SQLAlchemy/GeoAlchemy2 data types. 
+        column_types: dict, optional. Mapping of column names to SQLAlchemy/GeoAlchemy2 data types.
             If not provided, all columns will use the default data type.
         primary_keys: list of str, optional. Names of columns that should be set as primary keys.
-        default_type: SQLAlchemy data type, optional. Default data type to be used for columns 
+        default_type: SQLAlchemy data type, optional. Default data type to be used for columns
             not specified in column_types. Defaults to TEXT in PostgreSQL.
         logger: Logger object, optional. Logger for recording messages during the table creation process.
 
@@ -97,32 +123,54 @@ def create_table_in_pgdb(engine, table_name, schema, column_names, column_types=
     """
     # Initialize metadata object
     metadata = MetaData()
+    _define_table(metadata, table_name, schema, column_names, column_types, primary_keys,
+                  default_type, default_primary, logger=logger)
 
-    # Define columns for the table
-    columns = []
-    for name in column_names:
-        # Check if the column is a primary key and set type to type specified
-        if primary_keys and name in primary_keys:
-            logger.info(f"Primary key detected setting to {default_primary}")
-            col_type = default_primary
-        # Determine the column type
-        elif column_types and name in column_types:
-            col_type = column_types[name]
-        else:
-            col_type = default_type
+    try:
+        # Create the table in the database
+        metadata.create_all(engine)
+        logger.info("Table '%s' created successfully in PostGIS database.", table_name)
+    except Exception as e:
+        logger.error("Error creating table in PostGIS database: %s", e)
+        raise
 
-        # Define the column
-        columns.append(Column(name, col_type, primary_key=name in primary_keys if primary_keys else False))
+    return None
 
-    # Define the table with schema
-    table = Table(table_name, metadata, *columns, schema=schema)
+
+def create_tables_batch(engine, table_specs, default_type=TEXT, default_primary=TEXT(50), use_sys_geometry=False, logger=PrintLogger()):
+    """
+    Creates several tables in one round-trip batch using a single shared MetaData.
+
+    Creating tables one at a time issues a separate existence check plus CREATE per call;
+    registering all tables on one MetaData and calling create_all once amortizes those
+    round-trips across the whole batch.
+
+    Args:
+        engine: SQLAlchemy engine object. Represents the database connection where the tables will be created.
+        table_specs: list of tuples. Each tuple is
+            (table_name, schema, column_names, column_types, primary_keys), with column_types
+            and primary_keys allowed to be None, matching the single-table functions.
+        default_type: SQLAlchemy data type, optional. Default data type for unspecified columns.
+        default_primary: SQLAlchemy data type, optional. Data type used for primary key columns.
+        use_sys_geometry: bool, optional. If True, 'geometry' columns use the custom SysGeometry
+            type for SQL Server. Defaults to False (PostgreSQL/GeoAlchemy2 types).
+        logger: Logger object, optional. Logger for recording messages during the table creation process.
+
+    Returns:
+        None. The function creates the tables in the database but does not return any value.
+    """
+    # One shared metadata object so create_all runs a single batch
+    metadata = MetaData()
+    for table_name, schema, column_names, column_types, primary_keys in table_specs:
+        _define_table(metadata, table_name, schema, column_names, column_types, primary_keys,
+                      default_type, default_primary, use_sys_geometry=use_sys_geometry, logger=logger)
 
     try:
-        # Create the table in the database
-        metadata.create_all(engine)
-        logger.info(f"Table '{table_name}' created successfully in PostGIS database.")
+        # Create all tables in the database, skipping any that already exist
+        metadata.create_all(engine, checkfirst=True)
+        logger.info("Batch of %s tables created successfully.", len(table_specs))
     except Exception as e:
-        logger.error(f"Error creating table in PostGIS database: {e}")
+        logger.error("Error creating tables in batch: %s", e)
         raise
 
-    return None
\ No newline at end of file
+    return None
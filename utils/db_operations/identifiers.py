@@ -0,0 +1,26 @@
+import re
+
+# Plain SQL identifier: letter or underscore followed by up to 62 word characters
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]{0,62}')
+
+
+def validate_identifier(name):
+    """
+    Validates that a schema, table or column name is a plain SQL identifier.
+
+    Several helpers interpolate identifier names directly into SQL text (identifiers
+    cannot be bound as parameters), so anything other than a simple identifier is
+    rejected up front rather than being spliced into a statement.
+
+    Args:
+        name (str): The identifier to validate.
+
+    Returns:
+        str: The validated identifier, unchanged.
+
+    Raises:
+        ValueError: If the name is not a valid SQL identifier.
+    """
+    if not isinstance(name, str) or not _IDENTIFIER_RE.fullmatch(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
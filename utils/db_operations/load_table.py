@@ -1,3 +1,4 @@
+import io
 import pandas as pd
 import logging
 import sys
@@ -6,16 +7,68 @@ import sqlalchemy
 from sqlalchemy import text
 
 from ..logger.default_logger import PrintLogger
+from .identifiers import validate_identifier
 
-def load_data_df(data, engine, table_name, schema, if_exists="replace", logger=PrintLogger()):
+def _copy_from_df(conn, data, table_name, schema):
+    """
+    Bulk-loads a DataFrame into an existing PostgreSQL table using COPY FROM STDIN.
+
+    COPY streams the rows in one statement instead of issuing parameterized INSERTs,
+    bypassing per-row SQLAlchemy type adaptation entirely. Geometry columns are
+    converted to hex-encoded WKB first so PostGIS accepts them.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): An open connection to the database.
+        data (pd.DataFrame): The DataFrame containing the data to be loaded.
+        table_name (str): The name of the (already existing) target table.
+        schema (str): The schema name of the target table.
+    """
+    # Identifier names are spliced into the COPY statement, so validate them first
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
+    for col in data.columns:
+        validate_identifier(col)
+
+    # Convert any geometry columns to hex-encoded WKB for PostGIS
+    geom_cols = [col for col in data.columns if str(data[col].dtype) == 'geometry']
+    if geom_cols:
+        data = data.copy()
+        for col in geom_cols:
+            data[col] = data[col].to_wkb(hex=True)
+
+    buffer = io.StringIO()
+    data.to_csv(buffer, index=False, header=False, sep='\t', na_rep='\\N')
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{col}"' for col in data.columns)
+    copy_sql = (f'COPY "{schema}"."{table_name}" ({columns}) '
+                f"FROM STDIN WITH (FORMAT CSV, DELIMITER E'\\t', NULL '\\N')")
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(copy_sql, buffer)
+    finally:
+        cursor.close()
+
+
+def load_data_df(data, engine, table_name, schema, if_exists="replace", method="multi", chunksize=10000, logger=PrintLogger()):
     """
     Load data into a database table using SQLAlchemy and Pandas.
 
+    On PostgreSQL the rows are streamed with COPY FROM STDIN, the canonical bulk-load
+    route; pandas to_sql is only used to create or replace the table itself. On other
+    dialects rows are inserted with multi-row INSERT statements in chunks, which
+    combines with the psycopg2 fast-execution batch mode configured on the engine
+    instead of falling back to one INSERT per row.
+
     Args:
         data (pd.DataFrame): The DataFrame containing the data to be loaded.
         engine (sqlalchemy.engine.base.Connection): The SQLAlchemy database engine connection.
         table_name (str): The name of the database table to which the data will be loaded.
         schema (str): The schema name of the database table.
+        method (str, optional): Insert method passed to pandas to_sql on non-PostgreSQL dialects.
+                                Default is "multi" (multi-row INSERTs).
+        chunksize (int, optional): Number of rows written per batch. Default is 10000.
         logger (Logger, optional): The logger object for logging transaction and error messages.
                                    Default is PrintLogger().
 
@@ -26,14 +79,26 @@ def load_data_df(data, engine, table_name, schema, if_exists="replace", logger=P
         transaction = conn.begin()  # Start a new transaction
         logger.info("Transaction initiated.")
         try:
-            data.to_sql(table_name, schema=schema, con=conn, index=False, if_exists=if_exists)
+            if conn.dialect.name == 'postgresql':
+                # Create/replace/append the target table via pandas, then stream the rows with COPY
+                data.head(0).to_sql(table_name, schema=schema, con=conn, index=False, if_exists=if_exists)
+                _copy_from_df(conn, data, table_name, schema)
+            else:
+                effective_chunksize = chunksize
+                if method == "multi" and conn.dialect.name == 'mssql':
+                    # SQL Server caps a statement at 2100 bound parameters, and a
+                    # multi-row INSERT binds rows x cols per chunk, so clamp the
+                    # chunk size to stay under the limit
+                    effective_chunksize = min(chunksize, max(2100 // max(len(data.columns), 1) - 1, 1))
+                data.to_sql(table_name, schema=schema, con=conn, index=False, if_exists=if_exists,
+                            method=method, chunksize=effective_chunksize)
             transaction.commit()  # commit transaction
             logger.info("Data committed successfully.")
         except Exception as e:
             transaction.rollback()
-            logger.error(f"An error occurred, rolled back transaction. Error: {e}") # Records load error
+            logger.error("An error occurred, rolled back transaction. Error: %s", e) # Records load error
             sys.exit(1)  # Exiting the script with a non-zero value to indicate an error
             raise
     logger.info("Transaction ended.")
-    
-    return None
\ No newline at end of file
+
+    return None
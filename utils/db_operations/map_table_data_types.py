@@ -1,45 +1,77 @@
 import re
-import pandas as pd
-import geopandas as gpd
 from sqlalchemy import Integer, Float, String, DateTime, LargeBinary, NVARCHAR, Text, TIMESTAMP, Boolean, Date, Time, Numeric, Interval
-from geoalchemy2 import Geometry
-from shapely.geometry import Point, LineString, Polygon, MultiPoint, MultiLineString, MultiPolygon
-from shapely.wkt import loads as load_wkt
-
 
 from ..logger.default_logger import PrintLogger
 
+# geoalchemy2 (which pulls in heavy geospatial dependencies) is imported lazily inside
+# the mapping functions so that importing this module stays cheap for non-geometry work.
+
+# Matches any of the basic WKT geometry types at the start of the string; compiled once
+# at import time rather than per is_wkt_geometry call
+_WKT_RE = re.compile(
+    r'^\s*(POINT|LINESTRING|POLYGON|MULTIPOINT|MULTILINESTRING|MULTIPOLYGON|GEOMETRYCOLLECTION)\b',
+    re.IGNORECASE)
+
+# Dtype lookup tables built once at import time rather than per call
+_MSSQL_DTYPE_MAP = {
+    'int64': Integer,
+    'float64': Float,
+    'object': NVARCHAR,
+    'datetime64[ns]': DateTime,
+    'bool': Integer,  # SQL Server doesn't have a boolean type, often mapped to int
+    # Add other data types as needed
+}
+
+_SQLA_DTYPE_MAP = {
+    'int64': Integer,
+    'int32': Integer,
+    'float64': Float,
+    'float32': Float,
+    'object': Text,
+    'datetime64[ns]': TIMESTAMP,
+    'bool': Boolean,
+    'timedelta[ns]': Interval,
+    'datetime64[ns, tz]': TIMESTAMP(timezone=True),
+    'date': Date,
+    'time': Time,
+    'category': String,
+    'string': Text,
+    'bytes': LargeBinary,
+    'UInt8': Integer,
+    'UInt16': Integer,
+    'UInt32': Integer,
+    'UInt64': Integer,
+    'Int8': Integer,
+    'Int16': Integer,
+    'Int32': Integer,
+    'Int64': Integer,
+    'float16': Float,
+    'complex': String,
+    'decimal': Numeric,
+}
+
+
 def map_dataframe_dtypes_to_azure_ms_sql(df, logger=PrintLogger()):
     """
     Maps DataFrame dtypes to Azure SQL Server types, including geometry.
 
     Args:
         df: Pandas DataFrame.
-    Return: 
+    Return:
         Dictionary with column names as keys and Azure SQL Server data types as values.
     """
-    
-    dtype_map = {
-        'int64': Integer,
-        'float64': Float,
-        'object': NVARCHAR,
-        'datetime64[ns]': DateTime,
-        'bool': Integer,  # SQL Server doesn't have a boolean type, often mapped to int
-        # Add other data types as needed
-    }
+    dtype_map = _MSSQL_DTYPE_MAP
 
     # Special handling for geometry data type
     # Assuming geometry data is stored in 'geometry' column in GeoDataFrame
     # GeoPandas is used for handling geometric data in DataFrames
     if 'geometry' in df.columns:
-        logger.info(f"geometry data type detected")
-        dtype_map['geometry'] = Geometry
+        from geoalchemy2 import Geometry
+        logger.info("geometry data type detected")
+        dtype_map = dict(_MSSQL_DTYPE_MAP, geometry=Geometry)
 
-    sql_dtypes = {}
-    for col in df.columns:
-        pandas_dtype = str(df[col].dtype)
-        sql_dtype = dtype_map.get(pandas_dtype, String)  # Default to String if dtype not found
-        sql_dtypes[col] = sql_dtype
+    # Map all columns in one vectorized pass; default to String if dtype not found
+    sql_dtypes = df.dtypes.astype(str).map(dtype_map).fillna(String).to_dict()
 
     return sql_dtypes
 
@@ -52,55 +84,28 @@ def map_dataframe_dtypes_to_sqlalchemy(df, logger=PrintLogger()):
     Args:
         df: Pandas DataFrame or GeoPandas GeoDataFrame.
 
-    Return: 
+    Return:
         Dictionary with column names as keys and SQLAlchemy/GeoAlchemy2 data types as values.
     """
-
-    dtype_map = {
-        'int64': Integer,
-        'int32': Integer,
-        'float64': Float,
-        'float32': Float,
-        'object': Text,
-        'datetime64[ns]': TIMESTAMP,
-        'bool': Boolean,
-        'timedelta[ns]': Interval,
-        'datetime64[ns, tz]': TIMESTAMP(timezone=True),
-        'date': Date,
-        'time': Time,
-        'category': String,
-        'string': Text, 
-        'bytes': LargeBinary,
-        'UInt8': Integer,
-        'UInt16': Integer,
-        'UInt32': Integer,
-        'UInt64': Integer,
-        'Int8': Integer,
-        'Int16': Integer,
-        'Int32': Integer,
-        'Int64': Integer,
-        'float16': Float, 
-        'complex': String,
-        'decimal': Numeric,
-    }
-
-    sqlalchemy_dtypes = {}
-    for col in df.columns:
-        pandas_dtype = str(df[col].dtype)
-        
-        if pandas_dtype == 'object' and is_wkt_geometry(df[col], logger=logger):
-            logger.info(f"Column '{col}' contains WKT-formatted strings, mapping to Geometry.")
+    from geoalchemy2 import Geometry
+
+    # Map all columns in one vectorized pass; default to Text if dtype not found
+    sqlalchemy_dtypes = df.dtypes.astype(str).map(_SQLA_DTYPE_MAP).fillna(Text).to_dict()
+
+    # Overlay geometry detection: WKT strings only occur in object-dtype columns, and in
+    # practice only in columns whose name suggests geometry, so prune the scan to those
+    geom_candidates = [col for col in df.select_dtypes(include='object').columns
+                       if col == 'geometry' or 'geom' in col.lower() or 'wkt' in col.lower()]
+    for col in geom_candidates:
+        if is_wkt_geometry(df[col], logger=logger):
+            logger.info("Column '%s' contains WKT-formatted strings, mapping to Geometry.", col)
             # Column contains WKT-formatted strings
             sqlalchemy_dtypes[col] = Geometry
-        elif hasattr(df, 'geometry') and col == df.geometry.name:
-            logger.info(f"Column '{col}' is identified as GeoDataFrame geometry column, mapping to Geometry.")
-            # GeoDataFrame geometry column
-            sqlalchemy_dtypes[col] = Geometry
-        else:
-            # Other non-spatial data types
-            mapped_type = dtype_map.get(pandas_dtype, Text)  # Default to Text if dtype not found
-            logger.info(f"Mapping column '{col}' with pandas dtype '{pandas_dtype}' to {mapped_type}.")
-            sqlalchemy_dtypes[col] = mapped_type
+
+    # GeoDataFrame geometry column
+    if hasattr(df, 'geometry') and df.geometry.name in sqlalchemy_dtypes:
+        logger.info("Column '%s' is identified as GeoDataFrame geometry column, mapping to Geometry.", df.geometry.name)
+        sqlalchemy_dtypes[df.geometry.name] = Geometry
 
     return sqlalchemy_dtypes
 
@@ -108,22 +113,17 @@ def map_dataframe_dtypes_to_sqlalchemy(df, logger=PrintLogger()):
 def is_wkt_geometry(series, logger=PrintLogger()):
     """
     Checks if a pandas Series contains WKT-formatted strings.
-    
+
     Args:
         series (pd.Series): The pandas Series to check.
-    
+
     Returns:
         bool: True if the series contains WKT geometries, False otherwise.
     """
-    # Sample a few non-null values to check for WKT pattern
-    sample_values = series.dropna().head(5)
-    
-    # Basic WKT patterns
-    wkt_patterns = ['POINT', 'LINESTRING', 'POLYGON', 'MULTIPOINT', 'MULTILINESTRING', 'MULTIPOLYGON', 'GEOMETRYCOLLECTION']
-    
-    for value in sample_values:
-        if any(value.startswith(pattern) for pattern in wkt_patterns):
-            logger.info(f"Detected WKT pattern in value.")
-            return True
+    # Sample a few non-null values and test them in one vectorized pass
+    sample_values = series.dropna().head(20)
+    if sample_values.astype(str).str.match(_WKT_RE).any():
+        logger.info("Detected WKT pattern in value.")
+        return True
     logger.info("No WKT patterns detected in sampled values.")
     return False
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy.sql import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from ...logger.default_logger import PrintLogger
+from ..identifiers import validate_identifier
 
 def set_table_stsrid(epsg_number, engine, table_name, schema, geom_col="geometry", logger=PrintLogger()):
     """
@@ -19,22 +20,33 @@ def set_table_stsrid(epsg_number, engine, table_name, schema, geom_col="geometry
     Raises:
         Exception: If any error occurs during the SQL execution, it is logged and re-raised.
     """
-    
+    # Identifier names are spliced into the SQL text, so validate them first
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
+    geom_col = validate_identifier(geom_col)
+    epsg_number = int(epsg_number)
+
     sql = text(f"""
     UPDATE [{schema}].[{table_name}]
     SET {geom_col}.STSrid = {epsg_number};
     """)
        
     try:
-        logger.info(f"Updating SRID for: {table_name}")
+        logger.info("Updating SRID for: %s", table_name)
         with engine.connect() as conn:
             with conn.begin():
                 conn.execute(sql)
-            logger.info(f"SRID updated")
+            logger.info("SRID updated")
     except Exception as e:
         logger.error(f"Failed to update SRID: {e}", exc_info=True)
         
 def add_stsrid_constraint(epsg_number, engine, table_name, schema, geom_col="geometry", logger=None):
+    # Identifier names are spliced into the SQL text, so validate them first
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
+    geom_col = validate_identifier(geom_col)
+    epsg_number = int(epsg_number)
+
     # Constructing the SQL command with proper formatting
     sql = text(f"""
     ALTER TABLE [{schema}].[{table_name}]
@@ -43,9 +55,9 @@ def add_stsrid_constraint(epsg_number, engine, table_name, schema, geom_col="geo
     """)
 
     try:
-        logger.info(f"Adding SRID constraint to: {table_name}.{geom_col}") if logger else print(f"Adding SRID constraint to: {table_name}.{geom_col}")
+        logger.info("Adding SRID constraint to: %s.%s", table_name, geom_col) if logger else print(f"Adding SRID constraint to: {table_name}.{geom_col}")
         with engine.connect() as conn:
             conn.execute(sql)
-        logger.info(f"SRID constraint added successfully") if logger else print(f"SRID constraint added successfully")
+        logger.info("SRID constraint added successfully") if logger else print(f"SRID constraint added successfully")
     except SQLAlchemyError as e:
-        logger.error(f"Failed to add SRID constraint: {e}", exc_info=True) if logger else print(f"Failed to add SRID constraint: {e}")
+        logger.error("Failed to add SRID constraint: %s", e, exc_info=True) if logger else print(f"Failed to add SRID constraint: {e}")
@@ -2,6 +2,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.sql import text
 
 from ...logger.default_logger import PrintLogger
+from ..identifiers import validate_identifier
 
 def create_spatial_index_uk_bounding(engine, schema, table_name, column_name="geometry", logger=PrintLogger()):
     """
@@ -13,6 +14,10 @@ def create_spatial_index_uk_bounding(engine, schema, table_name, column_name="ge
         param table_name: The table name.
         param column_name: The column name on which to create the spatial index.
     """
+    # Identifier names are spliced into the SQL text, so validate them first
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
+    column_name = validate_identifier(column_name)
     index_name = f"Index_{table_name}_1"
 
     sql = text(f"""
@@ -26,11 +31,11 @@ def create_spatial_index_uk_bounding(engine, schema, table_name, column_name="ge
     """)
        
     try:
-        logger.info(f"Creating spatial index for table: {table_name}")
+        logger.info("Creating spatial index for table: %s", table_name)
         with engine.connect() as conn:
             with conn.begin():
                 conn.execute(sql)
-            logger.info(f"Spatial index created")
+            logger.info("Spatial index created")
     except Exception as e:
         logger.error(f"Failed to create spatial index: {e}", exc_info=True)
         
@@ -44,6 +49,10 @@ def create_spatial_index_world_bounding(engine, schema, table_name, column_name=
         param table_name: The table name.
         param column_name: The column name on which to create the spatial index.
     """
+    # Identifier names are spliced into the SQL text, so validate them first
+    schema = validate_identifier(schema)
+    table_name = validate_identifier(table_name)
+    column_name = validate_identifier(column_name)
     index_name = f"Index_{table_name}_1"
 
     sql = text(f"""
@@ -57,10 +66,10 @@ def create_spatial_index_world_bounding(engine, schema, table_name, column_name=
     """)
 
     try:
-        logger.info(f"Creating spatial index for table: {table_name}")
+        logger.info("Creating spatial index for table: %s", table_name)
         with engine.connect() as conn:
             with conn.begin():
                 conn.execute(sql)
-            logger.info(f"Spatial index created")
+            logger.info("Spatial index created")
     except Exception as e:
         logger.error(f"Failed to create spatial index: {e}", exc_info=True)
\ No newline at end of file
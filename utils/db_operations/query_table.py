@@ -1,76 +1,217 @@
 import pandas as pd
 import geopandas as gpd
+import shapely
+from functools import lru_cache
 from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.engine import Engine
 
 from ..logger.default_logger import PrintLogger
+from .connection_db import connection_scope
+from .identifiers import validate_identifier
+
+# Rows fetched per chunk when streaming query results
+_QUERY_CHUNK_SIZE = 50_000
+
+
+@lru_cache(maxsize=256)
+def _compile(sql):
+    """
+    Returns a memoized TextClause for a SQL string.
+
+    text() re-lexes and re-binds the statement on every call, which is irrelevant
+    for one-off queries but adds up when the same query runs in a loop over many
+    parameter sets; TextClause objects are immutable, so caching them is safe.
+
+    Args:
+        sql (str): sql query string.
+
+    Returns:
+        sqlalchemy.sql.elements.TextClause: The compiled statement.
+    """
+    return text(sql)
+
+
+def _query_to_df(conn, sql_query, params=None):
+    """
+    Executes a query on an open connection and builds a DataFrame from streamed chunks.
+
+    Streaming with yield_per keeps only one chunk of rows in memory at a time instead
+    of materializing the full result as Row objects before pandas sees any of it.
+
+    Args:
+        conn (sqlalchemy.engine.Connection): An open connection to the database.
+        sql_query (str): sql query string.
+        params (dict, optional): A dictionary of parameters for the query. Defaults to None.
+
+    Returns:
+        dataframe: A pandas DataFrame containing the retrieved rows.
+    """
+    # Attach yield_per to the statement, not the connection: Connection.execution_options
+    # mutates the connection in place, which would leave stream_results set for any
+    # later statements a caller-managed connection runs. TextClause options are
+    # generative, so the cached clause from _compile is never modified.
+    statement = _compile(sql_query).execution_options(yield_per=_QUERY_CHUNK_SIZE)
+    result = conn.execute(statement, params or {})
+    frames = [pd.DataFrame(partition, columns=result.keys()) for partition in result.partitions()]
+    if frames:
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    return pd.DataFrame(columns=result.keys())
+
+
+def _query_to_df_arrow(engine, sql_query, params=None):
+    """
+    Attempts to run a query through an Arrow-native transport, bypassing SQLAlchemy's
+    per-row Row construction entirely.
+
+    Tries the ADBC PostgreSQL driver first, then connectorx. Returns None when no
+    Arrow-capable reader is installed or the query needs bound parameters, in which
+    case the caller falls back to the chunked SQLAlchemy path.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The SQLAlchemy engine connected to the database.
+        sql_query (str): sql query string.
+        params (dict, optional): A dictionary of parameters for the query. Defaults to None.
+
+    Returns:
+        dataframe or None: A pandas DataFrame, or None if no Arrow transport is available.
+    """
+    if params:
+        return None
+
+    # Driverless URL (e.g. postgresql:// rather than postgresql+psycopg2://)
+    url = engine.url.set(drivername=engine.url.get_backend_name()).render_as_string(hide_password=False)
+
+    if engine.dialect.name == 'postgresql':
+        try:
+            import adbc_driver_postgresql.dbapi as adbc_postgresql
+        except ImportError:
+            pass
+        else:
+            with adbc_postgresql.connect(url) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql_query)
+                    return cursor.fetch_arrow_table().to_pandas()
+
+    try:
+        import connectorx as cx
+    except ImportError:
+        return None
+    return cx.read_sql(url, sql_query, return_type="pandas")
+
 
 def query_database_to_df(engine, sql_query, logger=PrintLogger() ,params=None):
     """
     Executes a query from a .sql file using an SQLAlchemy engine and returns a pandas DataFrame.
 
+    When an Arrow-capable reader (ADBC or connectorx) is installed, the result set is
+    transferred columnar and never passes through Python-level row objects. Otherwise
+    results are fetched in chunks rather than with a single fetchall, which cuts peak
+    memory on large result sets.
+
     Args:
-        engine (sqlalchemy.engine.Engine): The SQLAlchemy engine connected to the database.
+        engine: The SQLAlchemy engine connected to the database, or an already-open
+            Connection (which avoids a pool checkout when chaining several queries).
         sql_query (str): sql query string.
         params (dict, optional): A dictionary of parameters for the query, to be used with named parameters in the SQL. Defaults to None.
 
     Returns:
         dataframe: A pandas DataFrame containing the retrieved rows.
-    """  
-    logger.info(f"Executing SQL query")
-
-    # Use the engine in a context manager to ensure proper resource management
-    with engine.connect() as conn:
-        # Execute the query with optional parameters
-        if params is not None:
-            query_result = conn.execute(text(sql_query), **params)
-        else:
-            query_result = conn.execute(text(sql_query))
-        
-        df = pd.DataFrame(query_result.fetchall(), columns=query_result.keys())
+    """
+    logger.info("Executing SQL query")
+
+    # Prefer an Arrow-native transport when one is available; it opens its own
+    # connection, so it only applies when given an Engine rather than a caller-managed
+    # Connection (whose transaction the query must see)
+    if isinstance(engine, Engine):
+        df = _query_to_df_arrow(engine, sql_query, params)
+        if df is not None:
+            logger.info("Query executed via Arrow transport and results retrieved successfully.")
+            return df
+
+    # Use a context manager to ensure proper resource management; a passed-in
+    # Connection is reused as-is and left open
+    with connection_scope(engine) as conn:
+        df = _query_to_df(conn, sql_query, params)
 
     logger.info("Query executed and results retrieved successfully.")
     return df
 
 
-def query_database_to_gdf(engine, sql_query, logger=PrintLogger(), params=None, geom_col='geometry'):
+def query_database_to_gdf(engine, sql_query, logger=PrintLogger(), params=None, geom_col='geometry', crs=None):
     """
     Executes a query from a .sql file using an SQLAlchemy engine and returns a GeoPandas GeoDataFrame.
 
+    For best performance select the geometry as WKB, e.g. ST_AsBinary(geom) AS geometry:
+    the whole column is then parsed in one vectorized shapely.from_wkb call instead of
+    per-row. Hex-encoded WKB (PostGIS's text representation) is handled the same way;
+    columns that already hold geometry objects pass through untouched.
+
     Args:
-        engine (sqlalchemy.engine.Engine): The SQLAlchemy engine connected to the database.
+        engine: The SQLAlchemy engine connected to the database, or an already-open
+            Connection (which avoids a pool checkout when chaining several queries).
         sql_query (str): sql query string.
         params (dict, optional): A dictionary of parameters for the query, to be used with named parameters in the SQL. Defaults to None.
         geom_col (str): The name of the column containing the geometry data. Defaults to 'geometry'.
+        crs (str, optional): The CRS to set on the result (e.g. 'EPSG:4326'). Defaults to None.
 
     Returns:
         geodataframe: A GeoPandas GeoDataFrame containing the retrieved rows and geometry.
     """
-   
-    logger.info(f"Executing SQL query")
 
-    # Use the engine in a context manager to ensure proper resource management
-    with engine.connect() as conn:
-        # Execute the query with optional parameters
-        if params is not None:
-            query_result = conn.execute(text(sql_query), **params)
-        else:
-            query_result = conn.execute(text(sql_query))
-        
-        # Create a DataFrame from the query result
-        df = pd.DataFrame(query_result.fetchall(), columns=query_result.keys())
+    logger.info("Executing SQL query")
+
+    # Use a context manager to ensure proper resource management; a passed-in
+    # Connection is reused as-is and left open
+    with connection_scope(engine) as conn:
+        # Fetch the result in streamed chunks rather than one big fetchall
+        df = _query_to_df(conn, sql_query, params)
+
+    # Parse WKB bytes / hex strings to geometries in one vectorized pass; from_wkb
+    # accepts bytes, memoryview and hex str alike and propagates None
+    geom_values = df[geom_col].to_numpy(dtype=object)
+    first_valid = next((v for v in geom_values if v is not None), None)
+    if first_valid is not None and not isinstance(first_valid, shapely.Geometry):
+        if isinstance(first_valid, memoryview):
+            # psycopg2 returns bytea columns as memoryviews, which from_wkb rejects
+            geom_values = [bytes(v) if v is not None else None for v in geom_values]
+        df[geom_col] = shapely.from_wkb(geom_values)
 
     # Convert the DataFrame to a GeoDataFrame
-    gdf = gpd.GeoDataFrame(df, geometry=geom_col)
+    gdf = gpd.GeoDataFrame(df, geometry=geom_col, crs=crs)
 
     logger.info("Query executed and GeoDataFrame created successfully.")
     return gdf
 
 
+def _split_sql_script(sql_script):
+    """
+    Splits a SQL script into individual statements.
+
+    Uses sqlparse when it is installed (which handles semicolons inside string
+    literals and comments correctly); otherwise falls back to a plain split on ';'.
+
+    Args:
+        sql_script (str): The full text of the SQL script.
+
+    Returns:
+        list of str: The non-empty statements in the script.
+    """
+    try:
+        import sqlparse
+        statements = sqlparse.split(sql_script)
+    except ImportError:
+        statements = sql_script.split(';')
+    return [stmt.strip() for stmt in statements if stmt.strip()]
+
+
 def run_sql_script(engine, script_path, logger=PrintLogger()):
     """
     Executes SQL commands from a script file using an SQLAlchemy engine.
 
+    All statements run inside one transaction, so the commit cost is paid once for the
+    whole script and statement batching configured on the engine (see the psycopg2
+    executemany settings in connection_db) applies to any bulk INSERTs.
+
     Args:
         engine (sqlalchemy.engine.Engine): The SQLAlchemy engine connected to the database.
         script_path (str): The file path of the SQL script.
@@ -80,15 +221,16 @@ def run_sql_script(engine, script_path, logger=PrintLogger()):
     with open(script_path, 'r') as file:
         sql_script = file.read()
 
-    logger.info(f"Executing SQL script from {script_path}")
+    logger.info("Executing SQL script from %s", script_path)
 
-    # Execute the SQL script
-    with engine.connect() as connection:
-        try:
-            connection.execute(sql_script)
-            logger.info("SQL script executed successfully.")
-        except Exception as e:
-            logger.error(f"An error occurred: {e}")
+    # Execute the statements inside a single transaction
+    try:
+        with engine.begin() as connection:
+            for statement in _split_sql_script(sql_script):
+                connection.execute(text(statement))
+        logger.info("SQL script executed successfully.")
+    except Exception as e:
+        logger.error("An error occurred: %s", e)
             
             
 def check_table_has_data(engine, schema, table_name, logger):
@@ -96,7 +238,8 @@ def check_table_has_data(engine, schema, table_name, logger):
     Check if a specified table in a given schema contains any data.
 
     Args:
-        engine (sqlalchemy.engine.Engine): The SQLAlchemy engine connected to the database.
+        engine: The SQLAlchemy engine connected to the database, or an already-open
+            Connection (which avoids a pool checkout when chaining several queries).
         schema (str): The schema name of the table.
         table_name (str): The name of the table to check.
         logger (object): A logger object for logging messages.
@@ -105,19 +248,28 @@ def check_table_has_data(engine, schema, table_name, logger):
         bool: True if the table has data, False otherwise.
     """
 
-    logger.info(f'Executing query to check if "{schema}"."{table_name}" has data.')
+    logger.info('Executing query to check if "%s"."%s" has data.', schema, table_name)
 
-    query = text(f'SELECT EXISTS (SELECT 1 FROM "{schema}"."{table_name}" LIMIT 1);')
+    validate_identifier(schema)
+    validate_identifier(table_name)
 
     try:
-        with engine.connect() as connection:
-            result = connection.execute(query).scalar()
-            if result:
+        with connection_scope(engine) as connection:
+            # Drop to the raw DBAPI cursor: a bare LIMIT 1 probe avoids SQLAlchemy's
+            # Row construction for a query whose answer is just "did a row come back"
+            cursor = connection.connection.cursor()
+            try:
+                cursor.execute(f'SELECT 1 FROM "{schema}"."{table_name}" LIMIT 1')
+                has_data = cursor.fetchone() is not None
+            finally:
+                cursor.close()
+            if has_data:
                 logger.info("Table contains data.")
                 return True
             else:
                 logger.info("Table is empty.")
                 return False
-    except SQLAlchemyError as e:
-        logger.error(f"An error occurred: {e}")
+    except Exception as e:
+        # Raw DBAPI errors are not wrapped in SQLAlchemyError, so catch broadly
+        logger.error("An error occurred: %s", e)
         return False
\ No newline at end of file
@@ -1,15 +1,21 @@
 import logging
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..logger.default_logger import PrintLogger
+from .connection_db import connection_scope
 
 def check_table_exists(engine, schema_name, table_name, logger=PrintLogger()):
     """
     Checks if a specified table exists in a given schema within a SQL database using SQLAlchemy.
 
+    The check is a single catalog lookup (to_regclass on PostgreSQL, information_schema
+    elsewhere) rather than a full metadata reflection, which would issue a cascade of
+    introspection queries just to answer yes/no.
+
     Args:
-        engine: SQLAlchemy engine object.
+        engine: SQLAlchemy engine object, or an already-open Connection (which avoids
+            a pool checkout when chaining several queries).
         schema_name (str): The name of the schema in which to check for the table.
         table_name (str): The name of the table to check for existence.
         logger (Logger, optional): Logger object for logging messages. Defaults to PrintLogger().
@@ -18,21 +24,25 @@ def check_table_exists(engine, schema_name, table_name, logger=PrintLogger()):
         bool: True if the table exists, False otherwise.
     """
     try:
-        # Create a MetaData instance
-        metadata = MetaData()
-
-        # Reflect metadata
-        with engine.connect() as conn:
-            metadata.reflect(bind=conn, schema=schema_name, only=[table_name])
-
-        # Check if table exists
-        full_table_name = f"{schema_name}.{table_name}" if schema_name else table_name
-        exists = full_table_name in metadata.tables
+        with connection_scope(engine) as conn:
+            if conn.dialect.name == 'postgresql' and schema_name:
+                # Single pg_catalog lookup; returns NULL when the relation does not exist
+                query = text("SELECT to_regclass(:qualified_name) IS NOT NULL")
+                params = {'qualified_name': f'"{schema_name}"."{table_name}"'}
+            elif schema_name:
+                query = text("SELECT EXISTS (SELECT 1 FROM information_schema.tables "
+                             "WHERE table_schema = :schema_name AND table_name = :table_name)")
+                params = {'schema_name': schema_name, 'table_name': table_name}
+            else:
+                query = text("SELECT EXISTS (SELECT 1 FROM information_schema.tables "
+                             "WHERE table_name = :table_name)")
+                params = {'table_name': table_name}
+            exists = bool(conn.execute(query, params).scalar())
 
         # Log the result
-        logger.info(f"Table '{table_name}' existence in schema '{schema_name}': {exists}")
+        logger.info("Table '%s' existence in schema '%s': %s", table_name, schema_name, exists)
         return exists
 
     except SQLAlchemyError as e:
-        logger.info(f"Table '{table_name}' existence in schema '{schema_name}': False")
-        return False
\ No newline at end of file
+        logger.info("Table '%s' existence in schema '%s': False", table_name, schema_name)
+        return False
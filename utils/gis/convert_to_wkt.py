@@ -1,6 +1,7 @@
 import geopandas as gpd
+import numpy as np
 import binascii
-from shapely import wkb
+import shapely
 from ..logger.default_logger import PrintLogger
 
 def convert_geometry_type_to_wkt(gdf, column="geometry", logger=PrintLogger()):
@@ -8,8 +9,9 @@ def convert_geometry_type_to_wkt(gdf, column="geometry", logger=PrintLogger()):
     Convert the geometry column of a GeoDataFrame to Well-Known Text (WKT) format.
 
     This function takes a GeoDataFrame and converts the specified geometry column
-    to WKT format. The original geometry column is dropped, and a new column with
-    the same name as the original one is created to store the converted WKT geometries.
+    to WKT format in place of the original geometries. The conversion runs as one
+    vectorized shapely.to_wkt call over the underlying geometry array, and the result
+    frame is a shallow copy sharing all other columns with the input.
 
     Args:
         gdf (geopandas.GeoDataFrame): The GeoDataFrame to convert.
@@ -20,16 +22,18 @@ def convert_geometry_type_to_wkt(gdf, column="geometry", logger=PrintLogger()):
         geopandas.GeoDataFrame: A new GeoDataFrame with the geometry column converted to WKT,
         or the original GeoDataFrame if an error occurs during conversion.
     """
-    logger.info(f"Converting {column} to WKT format")
+    logger.info("Converting %s to WKT format", column)
     try:
-        converted_gdf = gdf.copy()
-        converted_gdf['wkt'] = converted_gdf[column].to_wkt()
-        converted_gdf = converted_gdf.drop(column, axis=1) # Drop the column 'old_column'
-        converted_gdf = converted_gdf.rename(columns={'wkt': column}) # Rename 'current_column' to 'new_column'
-        logger.info(f"Converted to WKT")
-        
+        wkt_values = shapely.to_wkt(np.asarray(gdf[column].values), rounding_precision=-1)
+        # drop + assign share the untouched column blocks with the input, so the only
+        # new allocation is the WKT column itself (which ends up last, as before).
+        # A bare gdf.assign would be one shuffle fewer but leaves a GeoDataFrame whose
+        # active geometry column holds strings, which geopandas warns about.
+        converted_gdf = gdf.drop(columns=[column]).assign(**{column: wkt_values})
+        logger.info("Converted to WKT")
+
     except Exception as e:
-        logger.error(f"Error converting to WKT: {e}")
+        logger.error("Error converting to WKT: %s", e)
         return gdf
 
     return converted_gdf
@@ -59,8 +63,9 @@ def convert_wkb_column_to_geometries(df, wkb_column='geometry', logger=PrintLogg
     Convert a DataFrame column containing hexadecimal string representations of WKB geometries 
     to `shapely` geometry objects.
 
-    This function applies the conversion to each entry in the specified column of the DataFrame 
-    and replaces the original hexadecimal strings with their corresponding `shapely` geometry objects.
+    The whole column is parsed in one vectorized `shapely.from_wkb` call (which accepts
+    hex strings directly), replacing the original hexadecimal strings with their
+    corresponding `shapely` geometry objects without a per-row Python loop.
 
     Args:
         df (pandas.DataFrame): The DataFrame containing the WKB hexadecimal strings.
@@ -73,9 +78,9 @@ def convert_wkb_column_to_geometries(df, wkb_column='geometry', logger=PrintLogg
         Exception: If any error occurs during the conversion process.
     """
     try:
-        df[wkb_column] = df[wkb_column].apply(lambda x: wkb.loads(hex_to_wkb(x)))
-        logger.info(f"Successfully converted column '{wkb_column}' to geometry objects.")
+        df[wkb_column] = shapely.from_wkb(df[wkb_column].to_numpy(dtype=object))
+        logger.info("Successfully converted column '%s' to geometry objects.", wkb_column)
     except Exception as e:
-        logger.error(f"Error converting column '{wkb_column}' to geometry objects: {e}")
+        logger.error("Error converting column '%s' to geometry objects: %s", wkb_column, e)
         raise
     return df
@@ -1,14 +1,38 @@
 import geopandas as gpd
+from functools import lru_cache
+from pyproj import CRS
 
 from ..logger.default_logger import PrintLogger
 
+
+@lru_cache(maxsize=64)
+def _parse_crs(crs):
+    """
+    Returns a memoized pyproj CRS for a user input string.
+
+    CRS.from_user_input re-parses the definition on every call; caching means
+    repeated ensure_crs calls with the same target (the common case in pipelines)
+    pay the parse once.
+
+    Args:
+        crs (str): The CRS as user input, e.g. 'EPSG:4326' or a PROJ4 string.
+
+    Returns:
+        pyproj.CRS: The parsed CRS.
+    """
+    return CRS.from_user_input(crs)
+
+
 def ensure_crs(gdf, desired_crs="EPSG:4326", logger=PrintLogger()):
     """
     Checks the CRS (Coordinate Reference System) of a GeoDataFrame and converts it to the desired CRS if they don't match.
 
+    The comparison uses pyproj CRS equality rather than serializing the CRS to a
+    string on every call, so matching inputs return immediately.
+
     Args:
         gdf (GeoDataFrame): The GeoDataFrame whose CRS is to be checked.
-        desired_crs (str or dict): The desired CRS to which the GeoDataFrame should be converted if necessary. 
+        desired_crs (str or dict): The desired CRS to which the GeoDataFrame should be converted if necessary.
                                This can be a string like 'EPSG:4326' or a PROJ4 string.
 
     Returns:
@@ -18,13 +42,15 @@ def ensure_crs(gdf, desired_crs="EPSG:4326", logger=PrintLogger()):
         logger.error("The GeoDataFrame has no CRS defined.")
         raise ValueError("The GeoDataFrame has no CRS defined.")
 
-    # Check if the current CRS matches the desired CRS
-    if gdf.crs.to_string() != desired_crs:
+    # Check if the current CRS matches the desired CRS (dicts are unhashable, so
+    # they skip the cache)
+    target = _parse_crs(desired_crs) if isinstance(desired_crs, str) else CRS.from_user_input(desired_crs)
+    if gdf.crs != target:
         # Convert the GeoDataFrame to the desired CRS
         old_crs = gdf.crs
         gdf = gdf.to_crs(desired_crs)
-        logger.info(f"CRS converted to {desired_crs} from {old_crs}.")
+        logger.info("CRS converted to %s from %s.", desired_crs, old_crs)
     else:
-        logger.info(f"CRS already matches the desired CRS: {desired_crs}.")
+        logger.info("CRS already matches the desired CRS: %s.", desired_crs)
 
-    return gdf
\ No newline at end of file
+    return gdf
@@ -1,13 +1,33 @@
-import pyproj
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import shapely
 from pyproj import Transformer
-from shapely import geometry
-from shapely.ops import transform, nearest_points
-from functools import partial
+from shapely import STRtree
+from functools import lru_cache
 
 from ..logger.default_logger import PrintLogger
 
+
+@lru_cache(maxsize=64)
+def _get_transformer(src, dst, always_xy=True):
+    """
+    Returns a memoized pyproj Transformer for a CRS pair.
+
+    Building a Transformer parses PROJ strings and initializes pipelines, which
+    dominates latency when callers transform small inputs repeatedly; caching keyed
+    on the CRS strings amortizes that to a one-time cost per pair.
+
+    Args:
+        src (str): The source CRS, as a string (e.g. str(gdf.crs)).
+        dst (str): The destination CRS, as a string.
+        always_xy (bool, optional): Whether to enforce x, y axis order. Defaults to True.
+
+    Returns:
+        pyproj.Transformer: The transformer for the CRS pair.
+    """
+    return Transformer.from_crs(src, dst, always_xy=always_xy)
+
 def join_points_to_polygons(points_gdf, polygons_gdf, how="inner", predicate="within", logger=PrintLogger()):
     """
     Performs a spatial join between a GeoDataFrame of points and a GeoDataFrame of polygons. Each point is
@@ -29,6 +49,36 @@ def join_points_to_polygons(points_gdf, polygons_gdf, how="inner", predicate="wi
         logger.info("Adjusting CRS of points to match polygons.")
         points_gdf.to_crs(polygons_gdf.crs, inplace=True)
 
+    # When points vastly outnumber polygons, prefilter them to the polygons' bounding
+    # box so sjoin never sees candidates that cannot match. Only safe for an inner
+    # join, where dropped points would not appear in the result anyway; skipped when
+    # the two sides are comparable in size and the clip would not pay for itself.
+    if how == "inner" and len(polygons_gdf) and len(polygons_gdf) * 2 < len(points_gdf):
+        minx, miny, maxx, maxy = polygons_gdf.total_bounds
+        clipped_points = points_gdf.cx[minx:maxx, miny:maxy]
+        if len(clipped_points) < len(points_gdf):
+            logger.info("Prefiltered points to polygon bounds: %s of %s remain.",
+                        len(clipped_points), len(points_gdf))
+            points_gdf = clipped_points
+
+    # Fast path for the common inner/within case: query an STRtree of the polygons
+    # directly and assemble the result with positional takes, skipping sjoin's
+    # general-purpose dispatch. Requires disjoint column names so the output matches
+    # what sjoin would produce without suffixing.
+    overlap = (set(points_gdf.columns) & set(polygons_gdf.columns)) - {points_gdf.geometry.name}
+    if predicate == "within" and how == "inner" and not overlap:
+        tree = STRtree(np.asarray(polygons_gdf.geometry.values))
+        point_idx, poly_idx = tree.query(np.asarray(points_gdf.geometry.values), predicate='within')
+
+        left = points_gdf.iloc[point_idx]
+        right = polygons_gdf.drop(columns=[polygons_gdf.geometry.name]).iloc[poly_idx]
+        right.index = left.index
+
+        joined_gdf = pd.concat([left, right], axis=1)
+        joined_gdf.insert(len(points_gdf.columns), 'index_right', polygons_gdf.index[poly_idx])
+        logger.info("Spatial join completed.")
+        return joined_gdf
+
     # Perform the spatial join
     joined_gdf = gpd.sjoin(points_gdf, polygons_gdf, how=how, predicate=predicate)
     logger.info("Spatial join completed.")
@@ -50,13 +100,29 @@ def join_polygons(polygons_gdf1, polygons_gdf2, how="inner", predicate='intersec
     Returns:
     - GeoDataFrame: A GeoDataFrame containing the first set of polygons enhanced with attributes from the second set based on the spatial relationship.
     """
-    logger.info(f"Starting polygon to polygon join using {predicate} operation.")
+    logger.info("Starting polygon to polygon join using %s operation.", predicate)
     
     # Ensure that both GeoDataFrames are using the same CRS
     if polygons_gdf1.crs != polygons_gdf2.crs:
         logger.info("Adjusting CRS of the first polygon set to match the second.")
         polygons_gdf1.to_crs(polygons_gdf2.crs, inplace=True)
 
+    # For an inner join, clip both sides to the overlap of their bounding boxes so
+    # sjoin only considers polygons that could actually interact (dropped polygons
+    # would not appear in an inner result anyway)
+    if how == "inner" and len(polygons_gdf1) and len(polygons_gdf2):
+        bounds1 = polygons_gdf1.total_bounds
+        bounds2 = polygons_gdf2.total_bounds
+        minx, miny = max(bounds1[0], bounds2[0]), max(bounds1[1], bounds2[1])
+        maxx, maxy = min(bounds1[2], bounds2[2]), min(bounds1[3], bounds2[3])
+        if minx <= maxx and miny <= maxy:
+            clipped1 = polygons_gdf1.cx[minx:maxx, miny:maxy]
+            clipped2 = polygons_gdf2.cx[minx:maxx, miny:maxy]
+            if len(clipped1) < len(polygons_gdf1) or len(clipped2) < len(polygons_gdf2):
+                logger.info("Clipped inputs to their bounding-box overlap: %s of %s and %s of %s remain.",
+                            len(clipped1), len(polygons_gdf1), len(clipped2), len(polygons_gdf2))
+                polygons_gdf1, polygons_gdf2 = clipped1, clipped2
+
     # Perform the spatial join based on the specified spatial operation
     joined_gdf = gpd.sjoin(polygons_gdf1, polygons_gdf2, how=how, predicate=predicate)
     logger.info("Spatial join of polygons completed.")
@@ -87,7 +153,7 @@ def find_nearest_and_distance(gdf1, gdf2, gdf1_id="fid", gdf2_id="fid", logger=P
 
     # Check and log the original Coordinate Reference System (CRS)
     original_crs = gdf1.crs
-    logger.info(f"Original CRS for gdf1: {original_crs}")
+    logger.info("Original CRS for gdf1: %s", original_crs)
 
     # Ensure the geometry columns are correctly set
     gdf1 = gdf1.set_geometry('geometry')
@@ -95,48 +161,44 @@ def find_nearest_and_distance(gdf1, gdf2, gdf1_id="fid", gdf2_id="fid", logger=P
 
     # Estimate and log a suitable UTM CRS based on the first geometry in gdf1
     utm_crs = gdf1.estimate_utm_crs()
-    logger.info(f"Estimated UTM CRS: {utm_crs}")
+    logger.info("Estimated UTM CRS: %s", utm_crs)
 
     # Convert and log the conversion of both GeoDataFrames to the estimated UTM CRS
     gdf1_utm = gdf1.to_crs(utm_crs)
     gdf2_utm = gdf2.to_crs(utm_crs)
     logger.info("Converted gdf1 and gdf2 to UTM CRS for distance calculation.")
 
-    # Initialize data collection
-    data = []
-
-    # Create Transformer instances for transforming geometries between CRSs
-    transformer_to_utm = Transformer.from_crs(original_crs, utm_crs, always_xy=True)
-    transformer_to_original = Transformer.from_crs(utm_crs, original_crs, always_xy=True)
+    # Look up (or build once) the Transformer for this CRS pair
+    transformer_to_original = _get_transformer(str(utm_crs), str(original_crs))
 
-    for index, row in gdf1_utm.iterrows():
-        
-        # Calculate distances to all points in gdf2_utm and find the minimum
-        distances = gdf2_utm.geometry.apply(lambda geom: row.geometry.distance(geom))
-        nearest_idx = distances.idxmin()
+    # Query all nearest neighbors in one spatial-index pass instead of computing the
+    # full N x M distance matrix row by row in Python
+    tree = STRtree(np.asarray(gdf2_utm.geometry.values))
+    nearest_pos = tree.nearest(np.asarray(gdf1_utm.geometry.values))
+    nearest_geoms_utm = gdf2_utm.geometry.values.take(nearest_pos)
 
-        # Extract the nearest geometry and distance
-        nearest_geom_utm = gdf2_utm.geometry.loc[nearest_idx]
-        distance = distances[nearest_idx]
+    # Compute all distances in a single GEOS ufunc sweep
+    distances = shapely.distance(gdf1_utm.geometry.values, nearest_geoms_utm)
 
-        # Transform geometries back to the original CRS
-        row_geom_original = transformer_to_original.transform(*row.geometry.coords[0])
-        nearest_geom_original = transformer_to_original.transform(*nearest_geom_utm.coords[0])
-
-        # Append results including identifiers and transformed geometries
-        data.append({
-            'gdf1_id': gdf1.loc[index, gdf1_id],
-            'gdf2_id': gdf2.loc[nearest_idx, gdf2_id],
-            'geometry': gpd.GeoSeries([geometry.Point(row_geom_original)], crs=original_crs)[0],
-            'nearest_geometry': gpd.GeoSeries([geometry.Point(nearest_geom_original)], crs=original_crs)[0],
-            'distance_meters': distance
-        })
+    # Transform all coordinates back to the original CRS in one array-mode pyproj
+    # call per side, instead of a single-point FFI round-trip for every row
+    xs1, ys1 = shapely.get_x(gdf1_utm.geometry.values), shapely.get_y(gdf1_utm.geometry.values)
+    xs2, ys2 = shapely.get_x(nearest_geoms_utm), shapely.get_y(nearest_geoms_utm)
+    geoms_original = shapely.points(*transformer_to_original.transform(xs1, ys1))
+    nearest_geoms_original = shapely.points(*transformer_to_original.transform(xs2, ys2))
 
     # Log completion of the nearest point and distance calculation
     logger.info("Completed nearest point and distance calculation. Compiling results.")
 
-    # Convert results to a GeoDataFrame with the original CRS
-    results = gpd.GeoDataFrame(data, crs=original_crs)
+    # Assemble the result in one constructor call from whole columns; the id columns
+    # come straight from the underlying arrays instead of a per-row .loc lookup
+    results = gpd.GeoDataFrame({
+        'gdf1_id': gdf1[gdf1_id].to_numpy(),
+        'gdf2_id': gdf2[gdf2_id].to_numpy()[nearest_pos],
+        'geometry': geoms_original,
+        'nearest_geometry': nearest_geoms_original,
+        'distance_meters': distances
+    }, geometry='geometry', crs=original_crs)
 
     return results
 
@@ -152,9 +214,14 @@ def filter_intersecting_polygons(gdf1, gdf2):
     Returns:
         A new GeoDataFrame containing only the polygons from gdf1 that intersect with any polygon in gdf2.
     """
-    # This will create a boolean mask where each element is True if the polygon in gdf1 intersects
-    # with any polygon in gdf2, and False otherwise.
-    intersects_mask = gdf1['geometry'].apply(lambda x: gdf2['geometry'].intersects(x).any())
-    
+    # Query all intersecting pairs through an STRtree in one vectorized pass instead of
+    # testing each gdf1 polygon against every gdf2 polygon in Python
+    tree = STRtree(np.asarray(gdf2.geometry.values))
+    pairs = tree.query(np.asarray(gdf1.geometry.values), predicate='intersects')
+
+    # pairs[0] holds the positional indices of gdf1 polygons with at least one match
+    intersects_mask = np.zeros(len(gdf1), dtype=bool)
+    intersects_mask[pairs[0]] = True
+
     # Filter gdf1 using the mask to keep only intersecting polygons
     return gdf1[intersects_mask]
\ No newline at end of file
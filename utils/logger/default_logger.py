@@ -1,3 +1,6 @@
+import sys
+
+
 class PrintLogger:
     """
     A simple logger class that prints log messages to the console.
@@ -5,10 +8,20 @@ class PrintLogger:
     This class is intended as a replacement for standard logging
     when a full-fledged logging framework is not necessary.
 
+    Messages below the configured level are dropped before any formatting
+    happens, so passing format arguments lazily (message, *args) costs nothing
+    when the level is disabled. Output goes through sys.stdout.write, skipping
+    print's per-call overhead; sys.stdout is looked up at emit time so stdout
+    redirection (pytest capture, redirect_stdout) keeps working.
+
     Args:
-        info(message, *args): Prints an informational message prefixed with 'INFO:'. 
-        error(message, *args): Prints an error message prefixed with 'ERROR:'. 
-        debug(message, *args): Prints a debug message prefixed with 'DEBUG:'. 
+        level (str, optional): Minimum level to emit ('DEBUG', 'INFO' or 'ERROR').
+            Defaults to 'INFO'.
+
+    Methods:
+        info(message, *args): Prints an informational message prefixed with 'INFO:'.
+        error(message, *args): Prints an error message prefixed with 'ERROR:'.
+        debug(message, *args): Prints a debug message prefixed with 'DEBUG:'.
 
     Example usage:
         logger = PrintLogger()
@@ -16,17 +29,26 @@ class PrintLogger:
         logger.error("This is an error message %s", "with more detail")
         logger.debug("This is a debug message with two details: %s and %s", "detail1", "detail2")
     """
-    def info(self, message, *args):
+
+    LEVELS = {'DEBUG': 10, 'INFO': 20, 'ERROR': 40}
+
+    def __init__(self, level='INFO'):
+        self.level = self.LEVELS[level]
+
+    def _log(self, level, prefix, message, args):
+        if level < self.level:
+            return
         if args:
             message = message % args
-        print(f"INFO: {message}")
+        # Resolve sys.stdout per call: loggers are often created at import time as
+        # default arguments, and binding the stream then would bypass later redirection
+        sys.stdout.write(f"{prefix}{message}\n")
+
+    def info(self, message, *args):
+        self._log(20, "INFO: ", message, args)
 
     def error(self, message, *args):
-        if args:
-            message = message % args
-        print(f"ERROR: {message}")
+        self._log(40, "ERROR: ", message, args)
 
     def debug(self, message, *args):
-        if args:
-            message = message % args
-        print(f"DEBUG: {message}")
\ No newline at end of file
+        self._log(10, "DEBUG: ", message, args)
@@ -5,10 +5,61 @@ import requests
 
 from ..logger.default_logger import PrintLogger
 
+
+def _read_csv_stream(stream):
+    """
+    Parses a CSV byte stream into a DataFrame.
+
+    Uses pyarrow's multi-threaded C++ CSV reader when it is installed, which
+    tokenizes bytes directly without the Python-level parse loop; otherwise falls
+    back to pd.read_csv on the same stream.
+
+    Args:
+        stream: A file-like object yielding the raw CSV bytes.
+
+    Returns:
+        dataframe: A pandas DataFrame containing the parsed rows.
+    """
+    try:
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(stream)
+    table = pacsv.read_csv(stream)
+    # Plain numpy-backed dtypes keep the output identical to the pd.read_csv path;
+    # self_destruct releases the Arrow buffers as columns are converted
+    return table.to_pandas(self_destruct=True)
+
+
+def _read_geojson_bytes(raw_bytes):
+    """
+    Parses GeoJSON bytes into a GeoDataFrame.
+
+    Uses pyogrio (GDAL's vectorized reader) when it is installed, which parses
+    geometries in C instead of one shapely.geometry.shape call per feature;
+    otherwise falls back to gpd.GeoDataFrame.from_features.
+
+    Args:
+        raw_bytes (bytes): The raw GeoJSON response body.
+
+    Returns:
+        geodataframe: A GeoPandas GeoDataFrame containing the parsed features.
+    """
+    try:
+        import pyogrio
+    except ImportError:
+        import json
+        return gpd.GeoDataFrame.from_features(json.loads(raw_bytes)['features'])
+    return pyogrio.read_dataframe(io.BytesIO(raw_bytes))
+
+
 def request_response_to_df(request_url, response_format='json', is_geospatial=False, params=None, headers=None, logger=PrintLogger()):
     """
     Send a request to a given URL and process the response based on the specified format.
 
+    The request is made with stream=True so CSV responses are parsed straight off the
+    socket instead of being buffered in full (raw text plus parsed copy) first; JSON
+    responses still need the complete payload before parsing.
+
     Args:
         request_url (str): The URL to send the request to.
         response_format (str, optional): The format of the expected response. Defaults to 'json'.
@@ -24,30 +75,30 @@ def request_response_to_df(request_url, response_format='json', is_geospatial=Fa
             If response_format is 'csv', returns a DataFrame.
     """
     try:
-        response = requests.get(request_url, params=params, headers=headers)
-        
-        if response.status_code == 200:
-            if response_format == 'json':
-                # Process the response as JSON
-                data = response.json()
-                if is_geospatial:
-                    # Convert the JSON data to a GeoDataFrame for geospatial data
-                    data = gpd.GeoDataFrame.from_features(data['features'])
+        with requests.get(request_url, params=params, headers=headers, stream=True) as response:
+
+            if response.status_code == 200:
+                if response_format == 'json':
+                    if is_geospatial:
+                        # Parse the GeoJSON bytes to a GeoDataFrame for geospatial data
+                        data = _read_geojson_bytes(response.content)
+                    else:
+                        # Convert the JSON data to a DataFrame for normal data
+                        data = pd.json_normalize(response.json())
+                elif response_format == 'csv':
+                    # Parse the CSV directly from the response stream; decode_content
+                    # transparently inflates gzip/deflate transfer encodings
+                    response.raw.decode_content = True
+                    data = _read_csv_stream(response.raw) # Assuming the response content is text/csv
                 else:
-                    # Convert the JSON data to a DataFrame for normal data
-                    data = pd.json_normalize(data)
-            elif response_format == 'csv':
-                # Process the response as CSV
-                data = pd.read_csv(io.StringIO(response.text)) # Assuming the response content is text/csv
+                    logger.error("Unsupported response format: %s", response_format)
+                    data = None
             else:
-                logger.error(f"Unsupported response format: {response_format}")
+                logger.error("Failed to retrieve data: %s", response.status_code)
                 data = None
-        else:
-            logger.error("Failed to retrieve data", response.status_code)
-            data = None
-            
+
     except Exception as e:
-        logger.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
         data = None
 
-    return data
\ No newline at end of file
+    return data